@@ -8,14 +8,20 @@ Key behaviours:
 - Uses only the time window covered by the file: [first_valid_minute .. last_valid_minute]
 - Normalises timestamps to minute buckets (floor to minute)
 - If multiple samples land in the same minute, it averages them
+- Streams the CSV in chunks, so memory stays bounded on multi-year logs
 - Builds a complete minute timeline inside that window and reports gaps
 - Fills only INTERNAL gaps (between start and end) using a chosen policy
 
 Fill policies:
   - locf   : forward-fill last known power (default)
-  - interp : time interpolation, then forward-fill leading NaNs
+  - interp : linear interpolation across the 1-minute timeline, forward-filling any tail
   - none   : drop missing minutes (will undercount by construction)
 
+Requires pandas and numpy. If numba is installed, the per-minute scans are
+JIT-compiled (cached on disk when a writable cache directory exists);
+otherwise NumPy paths are used.
+If pyarrow is installed, the CSV is read with its typed streaming reader.
+
 Examples:
   python3 calc_ipmi_energy.py /mnt/data/power_212.csv
   python3 calc_ipmi_energy.py /mnt/data/power_212.csv --fill interp
@@ -25,12 +31,33 @@ Examples:
 from __future__ import annotations
 
 import argparse
+import re
 import sys
 from dataclasses import dataclass
-from typing import Optional, Dict, List, Tuple
+from typing import Callable, Iterable, Iterator, Optional, Dict, List, Tuple
 
+import numpy as np
 import pandas as pd
 
+try:
+    from numba import njit
+except ImportError:  # optional: fall back to the pure NumPy kernels
+    njit = None
+
+
+def _jit(fn):
+    """njit with an on-disk cache, or compiled per run when numba has nowhere writable to cache."""
+    try:
+        return njit(cache=True)(fn)
+    except RuntimeError:  # "no locator available", e.g. read-only image and no writable home
+        return njit(fn)
+
+try:
+    import pyarrow as pa
+    import pyarrow.csv as pa_csv
+except ImportError:  # optional: fall back to chunked pandas.read_csv
+    pa = None
+
 
 PREFERRED_POWER_COLS = [
     "watt", "watts", "power", "pwr", "power_w", "ipmi_watts",
@@ -43,6 +70,28 @@ EXCLUDE_COLS = {
     "site", "rack", "row",
 }
 
+# Gap-length buckets in minutes: [1-2], [3-15], [16-120], [121+]
+BUCKET_EDGES = np.array([3, 16, 121])
+BUCKET_NAMES = ["1-2", "3-15", "16-120", ">120"]
+
+# Timestamps such as 2024-05-01T12:34:56Z, 2024-05-01 12:34:56.123+02:00
+ISO8601_RE = re.compile(r"^\d{4}-\d{2}-\d{2}[T ]\d{2}:\d{2}(:\d{2}(\.\d+)?)?(Z|[+-]\d{2}:?\d{2})?$")
+
+# format="ISO8601" needs pandas 2.0+; 1.x (e.g. Ubuntu 22.04 apt) would treat it as a literal
+# strptime pattern, but already takes its ISO fast path when no format is given
+PANDAS_ISO8601_FORMAT = int(pd.__version__.split(".")[0]) >= 2
+
+NS_PER_MIN = 60_000_000_000
+
+# Rows sampled per column when auto-detecting the power column
+DETECT_SAMPLE_ROWS = 1000
+
+# Rows parsed per read_csv chunk; bounds memory independently of file length
+CHUNK_ROWS = 1_000_000
+
+# Bytes per pyarrow CSV block, roughly CHUNK_ROWS rows of a typical IPMI export
+ARROW_BLOCK_BYTES = 64 << 20
+
 
 @dataclass
 class GapReport:
@@ -90,27 +139,39 @@ def parse_args() -> argparse.Namespace:
     return p.parse_args()
 
 
+def match_preferred_power_col(columns: List[str], timecol: str) -> Optional[str]:
+    cols = [c for c in columns if c != timecol]
+    lc = {c: c.lower() for c in cols}
+    for pref in PREFERRED_POWER_COLS:
+        for c in cols:
+            if lc[c] == pref:
+                return c
+    return None
+
+
 def detect_power_col(df: pd.DataFrame, timecol: str) -> str:
     cols = [c for c in df.columns if c != timecol]
     if not cols:
         raise ValueError("No columns available besides the time column; cannot detect power column.")
 
     # 1) Exact match on preferred names (case-insensitive)
+    preferred = match_preferred_power_col(cols, timecol)
+    if preferred is not None:
+        return preferred
     lc = {c: c.lower() for c in cols}
-    for pref in PREFERRED_POWER_COLS:
-        for c in cols:
-            if lc[c] == pref:
-                return c
 
     # 2) Heuristic: first "mostly numeric" column excluding obvious metadata
     candidates = []
     for c in cols:
         if lc[c] in EXCLUDE_COLS:
             continue
-        s = pd.to_numeric(df[c], errors="coerce")
+        sample = df[c].head(DETECT_SAMPLE_ROWS)
+        s = pd.to_numeric(sample, errors="coerce")
         non_na = int(s.notna().sum())
         if non_na == 0:
             continue
+        if non_na == len(sample):
+            return c
         candidates.append((non_na, c))
 
     if not candidates:
@@ -124,46 +185,114 @@ def detect_power_col(df: pd.DataFrame, timecol: str) -> str:
     return candidates[0][1]
 
 
-def build_gap_report(full_idx: pd.DatetimeIndex, series: pd.Series, top_n: int) -> GapReport:
-    missing_mask = series.isna()
-    minutes_total = len(full_idx)
+def _scan_gaps_numpy(mm: np.ndarray, edges: np.ndarray) -> Tuple[np.ndarray, np.ndarray, np.ndarray, np.ndarray]:
+    """Run-length encode the missing mask: gap starts, lengths, per-bucket counts and minutes."""
+    # Rising/falling edges of the mask delimit the missing runs
+    boundaries = np.flatnonzero(np.diff(mm.astype(np.int8), prepend=0, append=0))
+    starts, ends = boundaries[0::2], boundaries[1::2]
+    lengths = ends - starts
+
+    bucket_idx = np.digitize(lengths, edges)
+    counts = np.bincount(bucket_idx, minlength=len(edges) + 1)
+    minutes = np.bincount(bucket_idx, weights=lengths, minlength=len(edges) + 1).astype(np.int64)
+    return starts, lengths, counts, minutes
+
+
+if njit is not None:
+    @_jit
+    def _scan_gaps_words_jit(words, n, edges):
+        """Single pass over the mask packed 64 minutes per word (bit i of word w = minute 64*w + i)."""
+        starts = np.empty(n // 2 + 1, dtype=np.int64)
+        lengths = np.empty(n // 2 + 1, dtype=np.int64)
+        counts = np.zeros(edges.shape[0] + 1, dtype=np.int64)
+        minutes = np.zeros(edges.shape[0] + 1, dtype=np.int64)
+
+        def record(g, end, run):
+            # Bucket index is the number of edges the run reaches; no branching
+            b = 0
+            for e in edges:
+                b += run >= e
+            counts[b] += 1
+            minutes[b] += run
+            starts[g] = end - run
+            lengths[g] = run
+            return g + 1
+
+        all_missing = ~np.uint64(0)
+        one = np.uint64(1)
+        g = 0
+        run = 0
+        for w in range(words.shape[0]):
+            word = words[w]
+            base = w * 64
+            # Whole words with no transition (long outages or clean stretches) cost one compare;
+            # padding bits past n are zero, so an all-ones word is always fully inside the window
+            if word == all_missing:
+                run += 64
+                continue
+            if word == 0:
+                if run > 0:
+                    g = record(g, base, run)
+                    run = 0
+                continue
+            for bit in range(min(64, n - base)):
+                if (word >> np.uint64(bit)) & one:
+                    run += 1
+                elif run > 0:
+                    g = record(g, base + bit, run)
+                    run = 0
+        if run > 0:
+            g = record(g, n, run)
+        return starts[:g], lengths[:g], counts, minutes
+
+
+def _scan_gaps_packed(mm: np.ndarray, edges: np.ndarray) -> Tuple[np.ndarray, np.ndarray, np.ndarray, np.ndarray]:
+    """JIT equivalent of _scan_gaps_numpy on a bit-packed mask (8x less data through cache)."""
+    packed = np.packbits(mm, bitorder="little")
+    packed = np.pad(packed, (0, -len(packed) % 8))
+    return _scan_gaps_words_jit(packed.view("<u8"), len(mm), edges)
+
+
+def _top_gaps(lengths: np.ndarray, top_n: int) -> np.ndarray:
+    """Indices of the top_n longest gaps, longest first; equal lengths stay in time order."""
+    if top_n <= 0 or lengths.size == 0:
+        return np.empty(0, dtype=np.int64)
+    if top_n < lengths.size:
+        # O(G) partition for the cut-off length; only the earliest gaps at the cut-off are kept
+        kth = np.partition(lengths, lengths.size - top_n)[lengths.size - top_n]
+        above = np.flatnonzero(lengths > kth)
+        ties = np.flatnonzero(lengths == kth)[: top_n - above.size]
+        idx = np.concatenate([above, ties])
+    else:
+        idx = np.arange(lengths.size)
+    return idx[np.argsort(-lengths[idx], kind="stable")]
+
+
+def build_gap_report(start_ts: pd.Timestamp, n_minutes: int, missing_mask: np.ndarray, top_n: int) -> GapReport:
+    minutes_total = n_minutes
     minutes_missing = int(missing_mask.sum())
     missing_pct = (minutes_missing / minutes_total * 100.0) if minutes_total else 0.0
 
-    # Identify missing runs (gaps)
-    gaps: List[Tuple[pd.Timestamp, pd.Timestamp, int]] = []
-    mm = missing_mask.to_numpy()
-    i = 0
-    while i < len(mm):
-        if mm[i]:
-            j = i
-            while j < len(mm) and mm[j]:
-                j += 1
-            gaps.append((full_idx[i], full_idx[j - 1], j - i))
-            i = j
-        else:
-            i += 1
-
-    buckets = [
-        ("1-2", 1, 2),
-        ("3-15", 3, 15),
-        ("16-120", 16, 120),
-        (">120", 121, 10**9),
+    # Identify missing runs (gaps) and bucket them by length
+    scan_gaps = _scan_gaps_packed if njit is not None else _scan_gaps_numpy
+    starts, lengths, counts, minutes = scan_gaps(missing_mask, BUCKET_EDGES)
+    ends = starts + lengths
+    bucket_counts = dict(zip(BUCKET_NAMES, counts.tolist()))
+    bucket_minutes = dict(zip(BUCKET_NAMES, minutes.tolist()))
+
+    # Timestamps only for the reported gaps, as offsets from the window start
+    order = _top_gaps(lengths, top_n)
+    gaps_sorted: List[Tuple[pd.Timestamp, pd.Timestamp, int]] = [
+        (
+            start_ts + pd.Timedelta(minutes=int(starts[i])),
+            start_ts + pd.Timedelta(minutes=int(ends[i] - 1)),
+            int(lengths[i]),
+        )
+        for i in order
     ]
-    bucket_counts = {k: 0 for k, _, _ in buckets}
-    bucket_minutes = {k: 0 for k, _, _ in buckets}
-
-    for _, __, length in gaps:
-        for k, a, b in buckets:
-            if a <= length <= b:
-                bucket_counts[k] += 1
-                bucket_minutes[k] += length
-                break
-
-    gaps_sorted = sorted(gaps, key=lambda x: x[2], reverse=True)[:top_n]
 
     return GapReport(
-        gap_count=len(gaps),
+        gap_count=len(lengths),
         minutes_missing=minutes_missing,
         missing_pct=missing_pct,
         bucket_counts=bucket_counts,
@@ -172,62 +301,252 @@ def build_gap_report(full_idx: pd.DatetimeIndex, series: pd.Series, top_n: int)
     )
 
 
-def compute_energy(df: pd.DataFrame, timecol: str, powercol: Optional[str], fill: str, tz: str, top_gaps: int) -> Result:
-    if timecol not in df.columns:
-        raise ValueError(f"Missing time column '{timecol}'. Columns: {list(df.columns)}")
+def _ffill_numpy(a: np.ndarray) -> np.ndarray:
+    """Forward-fill NaNs: carry the index of the last valid value with a running max."""
+    idx = np.where(~np.isnan(a), np.arange(len(a)), 0)
+    np.maximum.accumulate(idx, out=idx)
+    return a[idx]
+
+
+def _interp_linear_numpy(a: np.ndarray) -> np.ndarray:
+    """Linearly interpolate NaNs between valid neighbours; trailing NaNs take the last value."""
+    # The timeline is uniformly 1-minute spaced, so time interpolation is linear in position
+    valid = ~np.isnan(a)
+    if not valid.any():
+        return a.copy()
+    x = np.arange(len(a))
+    out = np.interp(x, x[valid], a[valid])
+    out[: np.argmax(valid)] = np.nan  # nothing to interpolate from before the first value
+    return out
+
+
+if njit is not None:
+    @_jit
+    def _interp_linear_jit(a):
+        """Single-pass equivalent of _interp_linear_numpy."""
+        n = a.shape[0]
+        out = a.copy()
+        prev = -1
+        i = 0
+        while i < n:
+            if not np.isnan(a[i]):
+                prev = i
+                i += 1
+                continue
+            nxt = i
+            while nxt < n and np.isnan(a[nxt]):
+                nxt += 1
+            if prev >= 0:
+                if nxt < n:
+                    step = (a[nxt] - a[prev]) / (nxt - prev)
+                    for j in range(i, nxt):
+                        out[j] = a[prev] + step * (j - prev)
+                else:
+                    for j in range(i, nxt):
+                        out[j] = a[prev]
+            i = nxt
+        return out
+
+
+def sniff_time_format(path: str, timecol: str) -> Tuple[Optional[str], bool]:
+    """Inspect the first timestamp in the file.
+
+    Returns (fmt, has_zone) for ISO-8601 timestamps, where fmt is "ISO8601" on pandas 2.0+ and None
+    on older pandas; returns (None, False) otherwise to let pandas infer.
+    """
+    sample = pd.read_csv(path, usecols=[timecol], nrows=DETECT_SAMPLE_ROWS)[timecol].dropna()
+    if sample.empty:
+        return None, False
+    first = sample.iloc[0]
+    m = ISO8601_RE.match(first.strip()) if isinstance(first, str) else None
+    if m is None:
+        return None, False
+    fmt = "ISO8601" if PANDAS_ISO8601_FORMAT else None
+    return fmt, m.group(3) is not None
+
+
+if njit is not None:
+    @_jit
+    def _ffill_sum_jit(a):
+        """Forward-fill and sum in one pass, without materialising the filled array."""
+        total = 0.0
+        n = 0
+        last = np.nan
+        for x in a:
+            if not np.isnan(x):
+                last = x
+            if not np.isnan(last):
+                total += last
+                n += 1
+        return total, n
+
+
+def _sum_filled(filled: np.ndarray) -> Tuple[float, int]:
+    # Accumulate in float64 so the float32 samples don't cost total precision
+    return float(filled.sum(dtype=np.float64)), int(filled.size)
+
+
+def _locf_sum_numpy(a: np.ndarray) -> Tuple[float, int]:
+    return _sum_filled(_ffill_numpy(a))
+
+
+def _interp_sum(a: np.ndarray) -> Tuple[float, int]:
+    interp_linear = _interp_linear_jit if njit is not None else _interp_linear_numpy
+    return _sum_filled(interp_linear(a))
+
+
+def _none_sum(a: np.ndarray) -> Tuple[float, int]:
+    return _sum_filled(a[~np.isnan(a)])
+
+
+# Fill policy -> kernel returning (sum of filled watts, minutes counted)
+FILL_REDUCERS: Dict[str, Callable[[np.ndarray], Tuple[float, int]]] = {
+    "locf": _ffill_sum_jit if njit is not None else _locf_sum_numpy,
+    "interp": _interp_sum,
+    "none": _none_sum,
+}
 
-    if powercol is None:
-        powercol = detect_power_col(df, timecol)
-    else:
-        if powercol not in df.columns:
-            raise ValueError(f"Missing power column '{powercol}'. Columns: {list(df.columns)}")
 
-    # Parse timestamps (handles 'Z'), convert to requested tz
-    t = pd.to_datetime(df[timecol], utc=True, errors="coerce")
-    if t.isna().all():
-        raise ValueError("All timestamps failed to parse. Check the timestamp format and --timecol.")
+ChunkSums = Tuple[np.ndarray, np.ndarray, np.ndarray, int]  # (epoch minutes, sums, counts, parsed)
 
-    df = df.copy()
-    df["_ts"] = t.dt.tz_convert(tz)
 
-    # Parse power values
-    df["_p"] = pd.to_numeric(df[powercol], errors="coerce")
-    df = df.dropna(subset=["_ts", "_p"]).sort_values("_ts")
-    if df.empty:
-        raise ValueError("No valid rows after parsing timestamps and power values.")
+def _sum_by_minute(minute: np.ndarray, *values: np.ndarray) -> Tuple[np.ndarray, ...]:
+    """Sort by minute and sum each run of equal minutes in one C pass: (unique minutes, *sums)."""
+    order = np.argsort(minute, kind="stable")
+    minute = minute[order]
+    uniq, first = np.unique(minute, return_index=True)
+    if not minute.size:
+        return (uniq,) + tuple(v.astype(np.float64) for v in values)
+    return (uniq,) + tuple(np.add.reduceat(v[order], first, dtype=np.float64) for v in values)
+
+
+def _reduce_minutes(ts: np.ndarray, p: np.ndarray) -> ChunkSums:
+    """Per-minute power sum/count (keyed by epoch minute), plus parsed timestamp count.
+
+    ts is naive UTC datetime64[ns] (NaT where unparsed), p is float32 watts (NaN where invalid).
+    """
+    valid = ~np.isnat(ts)
+    parsed = int(valid.sum())
 
-    # Normalise to minute buckets. If multiple readings per minute, average them.
-    df["_minute"] = df["_ts"].dt.floor("min")
-    per_min = df.groupby("_minute")["_p"].mean().sort_index()
+    # Normalise to minute buckets: integer-divide epoch nanoseconds (NaT is masked below).
+    # Zone offsets are whole minutes, so this matches flooring in the requested tz.
+    minute = ts.view(np.int64) // NS_PER_MIN
 
-    start = per_min.index.min()
-    end = per_min.index.max()
+    mask = valid & ~np.isnan(p)
+    minute, p = minute[mask], p[mask]
 
-    # Complete minute timeline INSIDE [start..end]
-    full_idx = pd.date_range(start=start, end=end, freq="1min", tz=tz)
-    series = per_min.reindex(full_idx)
+    # Sums and counts merge exactly across chunks
+    uniq, sums, counts = _sum_by_minute(minute, p, np.ones_like(p))
+    return uniq, sums, counts, parsed
 
-    gap_report = build_gap_report(full_idx, series, top_n=top_gaps)
 
-    # Fill policy (internal gaps only)
-    if fill == "locf":
-        filled = series.ffill()
-    elif fill == "interp":
-        filled = series.interpolate(method="time").ffill()
-    else:  # "none"
-        filled = series.dropna()
+def _reduce_chunk(df: pd.DataFrame, timecol: str, powercol: str, fmt: Optional[str]) -> ChunkSums:
+    """Parse one pandas chunk and reduce it with _reduce_minutes."""
+    # Parse timestamps (handles 'Z') as UTC, then keep them as naive datetime64[ns];
+    # the requested tz is only attached to the reported timestamps
+    t = pd.to_datetime(df[timecol], utc=True, format=fmt, errors="coerce")
+    ts = t.to_numpy(dtype="datetime64[ns]")
 
-    if filled.empty:
+    # Parse power values
+    # IPMI readings are whole (or tenth) watts, so float32 holds them with bytes to spare
+    p = pd.to_numeric(df[powercol], errors="coerce").to_numpy(dtype=np.float32)
+    return _reduce_minutes(ts, p)
+
+
+def _iter_pandas_chunks(
+    path: str, timecol: str, powercol: str, fmt: Optional[str], chunksize: int
+) -> Iterator[ChunkSums]:
+    for chunk in pd.read_csv(path, usecols=[timecol, powercol], chunksize=chunksize):
+        yield _reduce_chunk(chunk, timecol, powercol, fmt)
+
+
+def _iter_arrow_chunks(path: str, timecol: str, powercol: str) -> Iterator[ChunkSums]:
+    # Typed, multi-threaded streaming read: Arrow parses timestamps and floats itself,
+    # so batches convert straight to datetime64[ns] / float32 without pandas coercion
+    reader = pa_csv.open_csv(
+        path,
+        read_options=pa_csv.ReadOptions(use_threads=True, block_size=ARROW_BLOCK_BYTES),
+        convert_options=pa_csv.ConvertOptions(
+            include_columns=[timecol, powercol],
+            column_types={timecol: pa.timestamp("ns", "UTC"), powercol: pa.float32()},
+        ),
+    )
+    for batch in reader:
+        ts = batch.column(0).to_numpy(zero_copy_only=False)
+        p = batch.column(1).to_numpy(zero_copy_only=False)
+        yield _reduce_minutes(ts, p)
+
+
+def _merge_chunks(reduced: Iterable[ChunkSums]) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+    # Keep each chunk's per-minute partials and combine them once at the end; merging as we go
+    # would realign against every minute seen so far on each chunk
+    minute_parts: List[np.ndarray] = []
+    sum_parts: List[np.ndarray] = []
+    count_parts: List[np.ndarray] = []
+    parsed = 0
+    for minute, sums, counts, chunk_parsed in reduced:
+        minute_parts.append(minute)
+        sum_parts.append(sums)
+        count_parts.append(counts)
+        parsed += chunk_parsed
+
+    if parsed == 0:
+        raise ValueError("All timestamps failed to parse. Check the timestamp format and --timecol.")
+    # Minutes straddling a chunk boundary appear in both partials; sum them together
+    return _sum_by_minute(np.concatenate(minute_parts), np.concatenate(sum_parts), np.concatenate(count_parts))
+
+
+def _stream_reduce(
+    path: str, timecol: str, powercol: str, chunksize: int
+) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """Stream the CSV in chunks and return epoch minutes with their power sums and sample counts."""
+    # Sniff once: picks the reader, and every pandas chunk uses the same vectorised parser
+    fmt, has_zone = sniff_time_format(path, timecol)
+
+    # Arrow's typed reader rejects naive and non-ISO timestamps, so only zoned ISO files try it
+    if pa is not None and has_zone:
+        try:
+            return _merge_chunks(_iter_arrow_chunks(path, timecol, powercol))
+        except pa.ArrowInvalid:
+            # A later cell the typed reader rejects (e.g. non-numeric power);
+            # start over with pandas, which coerces those to NaT/NaN
+            pass
+    return _merge_chunks(_iter_pandas_chunks(path, timecol, powercol, fmt, chunksize))
+
+
+def compute_energy(path: str, timecol: str, powercol: str, fill: str, tz: str, top_gaps: int) -> Result:
+    minutes, sums, counts = _stream_reduce(path, timecol, powercol, CHUNK_ROWS)
+    if not minutes.size:
+        raise ValueError("No valid rows after parsing timestamps and power values.")
+
+    # If multiple readings per minute, average them
+    means = sums / counts
+    first_min = int(minutes.min())
+    last_min = int(minutes.max())
+
+    # Complete minute timeline INSIDE [start..end]: scatter each mean to its offset
+    values = np.full(last_min - first_min + 1, np.nan, dtype=np.float32)
+    values[minutes - first_min] = means
+
+    start = pd.Timestamp(first_min * NS_PER_MIN, unit="ns", tz="UTC").tz_convert(tz)
+    end = pd.Timestamp(last_min * NS_PER_MIN, unit="ns", tz="UTC").tz_convert(tz)
+    gap_report = build_gap_report(start, len(values), np.isnan(values), top_n=top_gaps)
+
+    # Fill policy (internal gaps only), reduced straight to a sum of watts per minute
+    if fill not in FILL_REDUCERS:
+        raise ValueError(f"Unknown fill policy '{fill}'.")
+    total_w, minutes_counted = FILL_REDUCERS[fill](values)
+    if minutes_counted == 0:
         raise ValueError("No data left after applying the selected fill policy.")
 
     # Energy: sum(W)/60000 = kWh, because each sample represents 1 minute
-    total_kwh = float((filled / 60000.0).sum())
-    avg_watts = float(filled.mean())
+    total_kwh = total_w / 60000.0
+    avg_watts = total_w / minutes_counted
 
     return Result(
         start=start,
         end=end,
-        minutes_total=len(full_idx),
+        minutes_total=len(values),
         powercol=powercol,
         avg_watts=avg_watts,
         total_kwh=total_kwh,
@@ -235,12 +554,32 @@ def compute_energy(df: pd.DataFrame, timecol: str, powercol: Optional[str], fill
     )
 
 
+def resolve_power_col(path: str, timecol: str, powercol: Optional[str]) -> str:
+    """Validate the requested columns against the CSV header, auto-detecting power if needed."""
+    # Header only: validate names and pick the power column without parsing data
+    header = pd.read_csv(path, nrows=0)
+    columns = list(header.columns)
+    if timecol not in columns:
+        raise ValueError(f"Missing time column '{timecol}'. Columns: {columns}")
+
+    if powercol is None:
+        powercol = match_preferred_power_col(columns, timecol)
+        if powercol is None:
+            # Heuristic detection needs a data sample, but never the metadata columns
+            probe_cols = [timecol] + [c for c in columns if c != timecol and c.lower() not in EXCLUDE_COLS]
+            probe = pd.read_csv(path, usecols=probe_cols, nrows=DETECT_SAMPLE_ROWS) if len(probe_cols) > 1 else header
+            powercol = detect_power_col(probe, timecol)
+    elif powercol not in columns:
+        raise ValueError(f"Missing power column '{powercol}'. Columns: {columns}")
+    return powercol
+
+
 def main() -> int:
     args = parse_args()
 
     try:
-        df = pd.read_csv(args.csv)
-        res = compute_energy(df, args.timecol, args.powercol, args.fill, args.tz, args.top_gaps)
+        powercol = resolve_power_col(args.csv, args.timecol, args.powercol)
+        res = compute_energy(args.csv, args.timecol, powercol, args.fill, args.tz, args.top_gaps)
     except Exception as e:
         print(f"ERROR: {e}", file=sys.stderr)
         return 2
@@ -261,7 +600,7 @@ def main() -> int:
     print(f"Missing minutes:    {gr.minutes_missing} / {res.minutes_total} ({gr.missing_pct:.2f}%)")
     print(f"Gap count:          {gr.gap_count}")
     print("Gap buckets (count / minutes):")
-    for k in ["1-2", "3-15", "16-120", ">120"]:
+    for k in BUCKET_NAMES:
         print(f"  {k:>6}:          {gr.bucket_counts[k]:>6} / {gr.bucket_minutes[k]:>6}")
 
     if gr.largest_gaps: